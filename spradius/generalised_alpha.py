@@ -25,11 +25,10 @@ mpmath.mp = PRECISION
 class generalised_alpha(alpha_family):
     def initialise(self, **kwargs):
         self.rho_infty = kwargs["rho_infty"]
-        self.alpha_m = mpmath.mpf((2 * self.rho_infty - 1)) / (
-            self.rho_infty + 1
-        )
-        self.alpha_f = mpmath.mpf(self.rho_infty) / (self.rho_infty + 1)
+        rho_infty = self.ctx.mpf(self.rho_infty)
+        self.alpha_m = (2 * rho_infty - 1) / (rho_infty + 1)
+        self.alpha_f = rho_infty / (rho_infty + 1)
         self.beta = (
-            mpmath.mpf(1.0) / 4.0 * (1 - self.alpha_m + self.alpha_f) ** 2
+            self.ctx.mpf(1.0) / 4.0 * (1 - self.alpha_m + self.alpha_f) ** 2
         )
-        self.gamma = mpmath.mpf(1.0) / 2.0 - self.alpha_m + self.alpha_f
+        self.gamma = self.ctx.mpf(1.0) / 2.0 - self.alpha_m + self.alpha_f
@@ -25,7 +25,7 @@ mpmath.mp = PRECISION
 class hht(alpha_family):
     def initialise(self, **kwargs):
         self.alpha = kwargs["alpha"]
-        self.alpha_f = mpmath.mpf(self.alpha)
-        self.alpha_m = mpmath.mpf(0)
-        self.beta = mpmath.mpf(1 + self.alpha_f) ** 2 / 4
-        self.gamma = mpmath.mpf(1.0) / 2.0 + self.alpha_f
+        self.alpha_f = self.ctx.mpf(self.alpha)
+        self.alpha_m = self.ctx.mpf(0)
+        self.beta = self.ctx.mpf(1 + self.alpha_f) ** 2 / 4
+        self.gamma = self.ctx.mpf(1.0) / 2.0 + self.alpha_f
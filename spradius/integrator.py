@@ -21,6 +21,18 @@ This ensures that the natural period is 1, therefore the input time
 step vector actually represents the vector of non-dimensional time
 steps often written as Delta t / T_1.
 
+Since the working precision is not verified, the spectral radius may
+alternatively be certified on the interval context of mpmath. In this
+case, the amplification matrix A of a single time step is computed in
+interval arithmetic and the spectral radius is enclosed directly, as
+rho(A^n)^(1/n) = rho(A) requires no powering. Starting from a low
+precision, the precision is doubled for each time step until the interval
+enclosing the spectral radius is narrower than the requested width, such
+that the cost is only paid at the time steps requiring it. Note that the
+certified value is rho(A) itself, which may slightly differ from the
+approximation computed with the point evaluation for the schemes with a
+three-dimensional amplification matrix.
+
 ..module:: integrator
   :synopsis: Integrator main class
 
@@ -34,26 +46,81 @@ import numpy as np
 
 from tqdm import tqdm
 
+from spradius.interval import spectral_radius_enclosure
+
 
 PRECISION = 30
 mpmath.mp = PRECISION
 
+# Bounds of the binary precision in the interval mode
+MIN_INTERVAL_PRECISION = 53
+MAX_INTERVAL_PRECISION = 2 ** 14
+
 
 class integrator(ABC):
+    """Integrator abstract class
+
+    Attributes
+    ----------
+    spectral_radius : array of float
+      Spectral radius (midpoint of the bounds in the interval mode)
+    spectral_radius_lower : array of float
+      Certified lower bound of the spectral radius (interval mode only)
+    spectral_radius_upper : array of float
+      Certified upper bound of the spectral radius (interval mode only)
+    interval_precision : array of int
+      Binary precision used for each time step (interval mode only)
+    """
+
+    def __init__(self, dt_list, num_steps=600, interval_width=None, **kwargs):
+        self.parameters = kwargs
+        self.set_context(mpmath)
+
+        if interval_width is not None and interval_width <= 0:
+            raise ValueError("The interval width must be positive.")
+
+        if interval_width is None:
+            self.spectral_radius = self.compute_spectral_radius(
+                dt_list, num_steps
+            )
+        else:
+            (
+                self.spectral_radius_lower,
+                self.spectral_radius_upper,
+                self.interval_precision,
+            ) = self.compute_spectral_radius_bounds(dt_list, interval_width)
+            self.spectral_radius = 0.5 * (
+                self.spectral_radius_lower + self.spectral_radius_upper
+            )
+
+    def set_context(self, ctx):
+        """Sets the arithmetic context and initialises the integrator.
+
+        The mass, damping, stiffness and the integration parameters are
+        (re)computed in the given context, which must be either mpmath
+        itself or its interval context mpmath.iv.
+
+        Parameters
+        ----------
+        ctx : module / MPIntervalContext
+          Arithmetic context
+        """
+        self.ctx = ctx
 
-    # Mass, damping and stiffness
-    mass = mpmath.mpf(1)
-    damp = mpmath.mpf(0)
-    stif = 4 * mpmath.pi ** 2
+        # Mass, damping and stiffness
+        self.mass = ctx.mpf(1)
+        self.damp = ctx.mpf(0)
+        self.stif = 4 * ctx.pi ** 2
 
-    def __init__(self, dt_list, num_steps=600, **kwargs):
-        self.initialise(**kwargs)
-        self.spectral_radius = self.compute_spectral_radius(dt_list, num_steps)
+        self.initialise(**self.parameters)
 
     @abstractmethod
     def initialise(self, **kwargs):
         """Initialises the specific integrator with the given keyword
         arguments.
+
+        The integration parameters must be created with self.ctx.mpf, such
+        that they are enclosed by intervals in the interval mode.
         """
         pass
 
@@ -178,3 +245,137 @@ class integrator(ABC):
             )
 
         return spectral_radius
+
+    def get_amplification_matrix(self, dt):
+        """Amplification matrix of a single time step.
+
+        The columns are obtained by integrating one time step for unit
+        initial conditions, in the current arithmetic context. Since a zero
+        initial acceleration is replaced by the equilibrium one, -stif *
+        init_disp, the first integration actually yields A (1, 0, -stif)^T
+        and the stiffness contribution of the third column is added back.
+
+        Parameters
+        ----------
+        dt : mfr / ivmpf
+          Time step
+
+        Returns
+        -------
+        amplification_matrix : list of list of mfr / ivmpf
+          Relevant components of the amplification matrix
+        """
+
+        columns = [
+            list(self.integrate(dt, 1, 1, 0, 0)),
+            list(self.integrate(dt, 1, 0, 1, 0)),
+            list(self.integrate(dt, 1, 0, 0, 1)),
+        ]
+
+        # Undo the equilibrium initial acceleration of the first column. In
+        # the two-dimensional case, the acceleration is not an independent
+        # variable and the first column is already the correct one.
+        ndim = self.get_amplification_matrix_dim()
+        if ndim == 3:
+            columns[0] = [
+                columns[0][i] + self.stif * columns[2][i] for i in range(3)
+            ]
+
+        return [[columns[j][i] for j in range(ndim)] for i in range(ndim)]
+
+    def compute_spectral_radius_bounds(
+        self,
+        dt_list,
+        width,
+        min_prec=MIN_INTERVAL_PRECISION,
+        max_prec=MAX_INTERVAL_PRECISION,
+    ):
+        """Certified spectral radius computation routine.
+
+        The amplification matrix of a single time step is computed in
+        interval arithmetic and its spectral radius is enclosed with
+        spradius.interval.spectral_radius_enclosure. For each time step, the
+        binary precision starts at min_prec and is doubled until the
+        interval is narrower than width or max_prec is reached. As the
+        bounds are rounded outwards to double precision, the escalation
+        also stops once they are adjacent doubles or remain unchanged after
+        doubling the precision, e.g. for widths below the double resolution
+        of the spectral radius. In these cases, the bounds are still
+        certified but may be wider than requested.
+
+        Parameters
+        ----------
+        dt_list : list /  array of float
+          List of all time steps to be evaluated
+        width : float
+          Requested width of the spectral radius interval
+        min_prec : int
+          Initial binary precision
+        max_prec : int
+          Maximum binary precision
+
+        Returns
+        -------
+        lower : array of float
+          Vector of lower bounds of the spectral radius
+        upper : array of float
+          Vector of upper bounds of the spectral radius
+        precision : array of int
+          Vector of binary precisions used for each time step
+        """
+
+        dt_array = np.array(dt_list)
+        num_points = np.size(dt_array, axis=0)
+
+        lower = np.zeros((num_points))
+        upper = np.zeros((num_points))
+        precision = np.zeros((num_points), dtype=int)
+
+        iv = mpmath.iv
+        old_prec = iv.prec
+
+        print(" ")
+        try:
+            for i_dt in tqdm(range(num_points)):
+
+                prec = min_prec
+                last_bounds = None
+                while True:
+                    iv.prec = prec
+                    self.set_context(iv)
+
+                    dt = iv.mpf(dt_array[i_dt])
+
+                    # Enclose the spectral radius of A
+                    amplification_matrix = self.get_amplification_matrix(dt)
+                    spectral_radius = spectral_radius_enclosure(
+                        amplification_matrix
+                    )
+
+                    # Round the bounds outwards to double precision
+                    lower[i_dt] = mpmath.libmp.to_float(
+                        spectral_radius._mpi_[0],
+                        rnd=mpmath.libmp.round_floor,
+                    )
+                    upper[i_dt] = mpmath.libmp.to_float(
+                        spectral_radius._mpi_[1],
+                        rnd=mpmath.libmp.round_ceiling,
+                    )
+                    precision[i_dt] = prec
+
+                    # Stop if the width is met or cannot be reduced further
+                    bounds = (lower[i_dt], upper[i_dt])
+                    if (
+                        upper[i_dt] - lower[i_dt] < width
+                        or upper[i_dt] <= np.nextafter(lower[i_dt], np.inf)
+                        or bounds == last_bounds
+                        or prec >= max_prec
+                    ):
+                        break
+                    last_bounds = bounds
+                    prec = min(2 * prec, max_prec)
+        finally:
+            iv.prec = old_prec
+            self.set_context(mpmath)
+
+        return lower, upper, precision
@@ -0,0 +1,175 @@
+"""Interval enclosure of the spectral radius.
+
+This module contains the routines required to enclose the spectral radius
+of a small interval matrix, as produced by integrating the equations of
+motion with the interval context of mpmath. Since mpmath does not provide
+an interval eigenvalue solver, the eigenvalues are taken as the roots of
+the characteristic polynomial and enclosed with the inclusion disks of
+Weierstrass' correction
+
+1. Braess D, Hadeler KP. Simultaneous inclusion of the zeros of a
+polynomial. Numerische Mathematik. 1973;21(2):161–5.
+
+2. Carstensen C. Inclusion of the roots of a polynomial based on
+Gerschgorin's theorem. Numerische Mathematik. 1991;59(1):349–60.
+
+Given pairwise distinct approximations z_i of the n roots of a monic
+polynomial p, all roots lie in the union of the disks centred at z_i with
+radius n |p(z_i)| / prod_{j != i} |z_i - z_j|, and each connected
+component of m disks contains exactly m roots. The approximations are
+obtained with mpmath.eig at the working precision of the interval
+context, such that the radii shrink as the precision is increased.
+
+..module:: interval
+  :synopsis: Interval enclosure of the spectral radius
+
+..moduleauthor:: A. M. Couto Carneiro <amcc@fe.up.pt>
+"""
+
+import mpmath
+
+
+def characteristic_polynomial(matrix):
+    """Coefficients of the characteristic polynomial of an interval matrix.
+
+    The coefficients are computed with the Faddeev-LeVerrier algorithm,
+    carried out entirely in interval arithmetic.
+
+    Parameters
+    ----------
+    matrix : list of list of ivmpf
+      Square interval matrix
+
+    Returns
+    -------
+    coeffs : list of ivmpf
+      Coefficients of the monic characteristic polynomial, from the
+      highest to the lowest degree
+    """
+
+    ndim = len(matrix)
+    coeffs = [mpmath.iv.mpf(1)]
+    aux = [[mpmath.iv.mpf(0) for j in range(ndim)] for i in range(ndim)]
+
+    for k in range(1, ndim + 1):
+        # M_k = A M_{k-1} + c_{n-k+1} I
+        aux = [
+            [
+                sum(matrix[i][m] * aux[m][j] for m in range(ndim))
+                + (coeffs[-1] if i == j else 0)
+                for j in range(ndim)
+            ]
+            for i in range(ndim)
+        ]
+
+        # c_{n-k} = -tr(A M_k) / k
+        trace = sum(
+            sum(matrix[i][m] * aux[m][i] for m in range(ndim))
+            for i in range(ndim)
+        )
+        coeffs.append(-trace / k)
+
+    return coeffs
+
+
+def complex_multiply(x, y):
+    """Product of two complex intervals stored as (real, imag) pairs."""
+    return (x[0] * y[0] - x[1] * y[1], x[0] * y[1] + x[1] * y[0])
+
+
+def complex_abs(x):
+    """Interval enclosure of the modulus of a complex interval."""
+    return mpmath.iv.sqrt(x[0] ** 2 + x[1] ** 2)
+
+
+def spectral_radius_enclosure(matrix):
+    """Interval enclosure of the spectral radius of an interval matrix.
+
+    The enclosure is valid for every point matrix contained in the
+    interval matrix. Whenever the inclusion disks cannot be computed, e.g.
+    if the approximate eigenvalues are not distinguishable at the current
+    precision, the enclosure falls back to [0, ||A||_inf].
+
+    Parameters
+    ----------
+    matrix : list of list of ivmpf
+      Square interval matrix
+
+    Returns
+    -------
+    spectral_radius : ivmpf
+      Interval containing the spectral radius
+    """
+
+    iv = mpmath.iv
+    ndim = len(matrix)
+
+    # Any induced norm bounds the spectral radius from above
+    norm = max(sum(abs(entry) for entry in row).b for row in matrix)
+    lower = iv.mpf(0)
+    upper = iv.mpf(norm)
+
+    # Approximate eigenvalues at the working precision of the interval
+    # context, which are exactly representable as interval endpoints
+    with mpmath.workprec(iv.prec):
+        midpoint = mpmath.matrix(
+            [[mpmath.mpf(entry.mid) for entry in row] for row in matrix]
+        )
+        approx = mpmath.eig(midpoint, left=False, right=False)
+    centres = [(iv.mpf(mpmath.re(z)), iv.mpf(mpmath.im(z))) for z in approx]
+
+    # Radii of the inclusion disks
+    coeffs = characteristic_polynomial(matrix)
+    radii = []
+    for i in range(ndim):
+        value = (coeffs[0], iv.mpf(0))
+        for coeff in coeffs[1:]:
+            value = complex_multiply(value, centres[i])
+            value = (value[0] + coeff, value[1])
+
+        product = (iv.mpf(1), iv.mpf(0))
+        for j in range(ndim):
+            if j != i:
+                diff = (
+                    centres[i][0] - centres[j][0],
+                    centres[i][1] - centres[j][1],
+                )
+                product = complex_multiply(product, diff)
+
+        denominator = complex_abs(product)
+        if denominator.a <= 0:
+            return iv.mpf([lower.a, upper.b])
+        radii.append(iv.mpf((ndim * complex_abs(value) / denominator).b))
+
+    moduli = [complex_abs(centre) for centre in centres]
+
+    # Group the overlapping disks into connected components
+    component = list(range(ndim))
+    for i in range(ndim):
+        for j in range(i + 1, ndim):
+            distance = complex_abs(
+                (
+                    centres[i][0] - centres[j][0],
+                    centres[i][1] - centres[j][1],
+                )
+            )
+            if distance.a <= (radii[i] + radii[j]).b:
+                old, new = component[j], component[i]
+                component = [new if c == old else c for c in component]
+
+    # Each component holds at least one eigenvalue, whose modulus is not
+    # smaller than the closest point of the component to the origin
+    for label in set(component):
+        closest = min(
+            (moduli[i] - radii[i]).a
+            for i in range(ndim)
+            if component[i] == label
+        )
+        if closest > lower.a:
+            lower = iv.mpf(closest)
+
+    farthest = max((moduli[i] + radii[i]).b for i in range(ndim))
+    if farthest < upper.b:
+        upper = iv.mpf(farthest)
+
+    return iv.mpf([lower.a, upper.b])
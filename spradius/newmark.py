@@ -23,11 +23,11 @@ mpmath.mp = PRECISION
 class newmark(alpha_family):
     def initialise(self, **kwargs):
         if len(kwargs) == 0:
-            self.beta = mpmath.mpf(0.25)
-            self.gamma = mpmath.mpf(0.5)
+            self.beta = self.ctx.mpf(0.25)
+            self.gamma = self.ctx.mpf(0.5)
         else:
-            self.beta = mpmath.mpf(kwargs["beta"])
-            self.gamma = mpmath.mpf(kwargs["gamma"])
+            self.beta = self.ctx.mpf(kwargs["beta"])
+            self.gamma = self.ctx.mpf(kwargs["gamma"])
         self.alpha_m = 0
         self.alpha_f = 0
 
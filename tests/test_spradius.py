@@ -1,6 +1,7 @@
 import os
 import pathlib
 
+import mpmath
 import numpy as np
 import pytest
 
@@ -33,3 +34,103 @@ def test_integrator(scheme):
     assert_allclose(
         scheme.spectral_radius, reference_values, rtol=1e-7, atol=0
     )
+
+
+def reference_spectral_radius(scheme, dt, num_steps=600, prec=400):
+    """Spectral radius computed independently of the one-step matrix.
+
+    The matrix A^n B is obtained by integrating num_steps time steps for
+    unit initial conditions, where B = [[1, 0, 0], [0, 1, 0], [-stif, 0, 1]]
+    stems from the equilibrium initial acceleration. B is removed and the
+    spectral radius is given by rho(A^n)^(1/n).
+    """
+    with mpmath.workprec(prec):
+        scheme.set_context(mpmath)
+        dt = mpmath.mpf(dt)
+        columns = [
+            scheme.integrate(dt, num_steps, 1, 0, 0),
+            scheme.integrate(dt, num_steps, 0, 1, 0),
+            scheme.integrate(dt, num_steps, 0, 0, 1),
+        ]
+        powered_matrix = mpmath.matrix(
+            [[columns[j][i] for j in range(3)] for i in range(3)]
+        )
+        inverse_equilibrium = mpmath.matrix(
+            [[1, 0, 0], [0, 1, 0], [scheme.stif, 0, 1]]
+        )
+
+        ndim = scheme.get_amplification_matrix_dim()
+        if ndim == 3:
+            powered_matrix = powered_matrix * inverse_equilibrium
+        powered_matrix = powered_matrix[0:ndim, 0:ndim]
+
+        eigenvalues = mpmath.eig(powered_matrix, left=False, right=False)
+        spectral_radius = mpmath.root(
+            max(mpmath.fabs(x) for x in eigenvalues), num_steps
+        )
+    scheme.set_context(mpmath)
+
+    return float(spectral_radius)
+
+
+@pytest.mark.parametrize(
+    "scheme, kwargs",
+    [(newmark, {"beta": 0.3025, "gamma": 0.6})]
+    + [(hht, {"alpha": 0.3})]
+    + [(generalised_alpha, {"rho_infty": 0.2})],
+)
+def test_integrator_interval(scheme, kwargs):
+    """Test if the certified bounds are narrow and contain the reference
+    spectral radius."""
+    scheme = scheme(dt, interval_width=1e-10, **kwargs)
+
+    reference_values = [reference_spectral_radius(scheme, x) for x in dt]
+
+    assert np.all(scheme.spectral_radius_lower <= reference_values)
+    assert np.all(scheme.spectral_radius_upper >= reference_values)
+    assert np.all(
+        scheme.spectral_radius_upper - scheme.spectral_radius_lower < 1e-10
+    )
+
+
+def test_generalised_alpha_interval_limit():
+    """Test if the certified bounds approach rho_infty for large steps."""
+    scheme = generalised_alpha([1e8], rho_infty=0.2, interval_width=1e-10)
+
+    assert np.all(scheme.spectral_radius_lower <= 0.2 + 1e-6)
+    assert np.all(scheme.spectral_radius_upper >= 0.2 - 1e-6)
+
+
+def test_trapezoidal_rule_interval():
+    """Test if the trapezoidal rule is certified to be non-dissipative and
+    if the precision is only escalated for tighter widths."""
+    loose = newmark(dt, interval_width=1e-3)
+    tight = newmark(dt, interval_width=1e-15)
+
+    for scheme in [loose, tight]:
+        assert np.all(scheme.spectral_radius_lower <= 1)
+        assert np.all(scheme.spectral_radius_upper >= 1)
+
+    assert np.all(loose.interval_precision == 53)
+    assert np.all(tight.interval_precision > 53)
+    assert np.all(
+        tight.spectral_radius_upper - tight.spectral_radius_lower < 1e-15
+    )
+
+
+def test_interval_precision_saturation():
+    """Test if the precision is not escalated beyond the double
+    resolution."""
+    scheme = hht([1.0], alpha=0.3, interval_width=1e-17)
+
+    assert np.all(scheme.interval_precision < 2 ** 14)
+    assert np.all(
+        scheme.spectral_radius_upper
+        <= np.nextafter(scheme.spectral_radius_lower, np.inf)
+    )
+
+
+def test_interval_width_positive():
+    """Test if a non-positive interval width is rejected."""
+    with pytest.raises(ValueError):
+        newmark(dt, interval_width=0)